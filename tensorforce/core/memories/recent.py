@@ -38,42 +38,46 @@ class Recent(Queue):
             (<span style="color:#00C000"><b>default</b></span>: inherit value of parent module).
     """
 
-    def tf_retrieve_timesteps(self, n, past_horizon, future_horizon):
-        one = tf.constant(value=1, dtype=util.tf_dtype(dtype='long'))
-        capacity = tf.constant(value=self.capacity, dtype=util.tf_dtype(dtype='long'))
+    def tf_initialize(self):
+        super().tf_initialize()
+
+        # Constants, shared by retrieve functions
+        self.one_tensor = tf.constant(value=1, dtype=util.tf_dtype(dtype='long'))
+        self.capacity_tensor = tf.constant(value=self.capacity, dtype=util.tf_dtype(dtype='long'))
 
+    def tf_retrieve_timesteps(self, n, past_horizon, future_horizon):
         # Check whether memory contains at least one valid timestep
-        num_timesteps = tf.minimum(x=self.buffer_index, y=capacity) - past_horizon - future_horizon
-        assertion = tf.debugging.assert_greater_equal(x=num_timesteps, y=one)
+        num_timesteps = tf.minimum(x=self.buffer_index, y=self.capacity_tensor)
+        num_timesteps = num_timesteps - past_horizon - future_horizon
+        assertion = tf.debugging.assert_greater_equal(x=num_timesteps, y=self.one_tensor)
 
         # Most recent timestep indices range
+        limit = self.buffer_index - future_horizon
+        start = limit - n
         with tf.control_dependencies(control_inputs=(assertion,)):
-            indices = tf.range(start=(self.buffer_index - n), limit=self.buffer_index)
-            indices = tf.math.mod(x=(indices - future_horizon), y=capacity)
+            indices = tf.range(start=start, limit=limit)
+            indices = tf.math.mod(x=indices, y=self.capacity_tensor)
 
         return indices
 
     def tf_retrieve_episodes(self, n):
-        zero = tf.constant(value=0, dtype=util.tf_dtype(dtype='long'))
-        one = tf.constant(value=1, dtype=util.tf_dtype(dtype='long'))
-        capacity = tf.constant(value=self.capacity, dtype=util.tf_dtype(dtype='long'))
-
         # Check whether memory contains at least one episode
-        assertion = tf.debugging.assert_greater_equal(x=self.episode_count, y=one)
+        assertion = tf.debugging.assert_greater_equal(x=self.episode_count, y=self.one_tensor)
 
         # Get start and limit index for most recent n episodes
         with tf.control_dependencies(control_inputs=(assertion,)):
             start = self.terminal_indices[self.episode_count - n]
             limit = self.terminal_indices[self.episode_count]
             # Increment terminal of previous episode
-            start = start + one
-            limit = limit + one
+            start = start + self.one_tensor
+            limit = limit + self.one_tensor
 
             # Correct limit index if smaller than start index
-            limit = limit + tf.where(condition=(limit < start), x=capacity, y=zero)
+            is_wrapped = tf.dtypes.cast(x=(limit < start), dtype=util.tf_dtype(dtype='long'))
+            limit = limit + self.capacity_tensor * is_wrapped
 
             # Most recent episode indices range
             indices = tf.range(start=start, limit=limit)
-            indices = tf.math.mod(x=indices, y=capacity)
+            indices = tf.math.mod(x=indices, y=self.capacity_tensor)
 
         return indices
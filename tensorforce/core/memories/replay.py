@@ -79,13 +79,8 @@ class Replay(Queue):
             limits = limits + one
 
             # Correct limit indices if smaller than start indices
-            zero_array = tf.fill(
-                dims=(n,), value=tf.constant(value=0, dtype=util.tf_dtype(dtype='long'))
-            )
-            capacity_array = tf.fill(
-                dims=(n,), value=tf.constant(value=self.capacity, dtype=util.tf_dtype(dtype='long'))
-            )
-            limits = limits + tf.where(condition=(limits < starts), x=capacity_array, y=zero_array)
+            is_wrapped = tf.dtypes.cast(x=(limits < starts), dtype=util.tf_dtype(dtype='long'))
+            limits = limits + capacity * is_wrapped
 
             # Concatenate randomly sampled episode indices ranges
             def cond(indices, i):